@@ -2,16 +2,310 @@ import sys
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                            QPushButton, QLabel, QFileDialog, QListWidget, 
                            QHBoxLayout, QLineEdit, QMessageBox, QGridLayout)
-from PyQt5.QtCore import Qt, QDateTime
+from PyQt5.QtCore import Qt, QDateTime, QObject, QThread, pyqtSignal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import os
+import queue
+import shutil
 import subprocess
 import platform
 
+if platform.system() == 'Windows':
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CreateFileW.argtypes = [
+        wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+        wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE
+    ]
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.SetFileTime.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(wintypes.FILETIME),
+        ctypes.POINTER(wintypes.FILETIME), ctypes.POINTER(wintypes.FILETIME)
+    ]
+    _kernel32.SetFileTime.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+
+    _FILE_WRITE_ATTRIBUTES = 0x0100
+    _FILE_SHARE_ALL = 0x0007
+    _OPEN_EXISTING = 3
+    _FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+
+def _set_windows_creation_time(file_path, file_timestamp):
+    """Set a file's creation time through kernel32.SetFileTime."""
+    # FILETIME counts 100ns intervals since 1601-01-01 UTC
+    ticks = int(file_timestamp * 10_000_000) + 116444736000000000
+    creation_time = wintypes.FILETIME(ticks & 0xFFFFFFFF, ticks >> 32)
+
+    handle = _kernel32.CreateFileW(
+        file_path, _FILE_WRITE_ATTRIBUTES, _FILE_SHARE_ALL, None,
+        _OPEN_EXISTING, _FILE_FLAG_BACKUP_SEMANTICS, None
+    )
+    if handle == _INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        if not _kernel32.SetFileTime(handle, ctypes.byref(creation_time), None, None):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        _kernel32.CloseHandle(handle)
+
+
+class _ExifToolDaemon:
+    """Long-lived ExifTool process driven through -stay_open argfile mode."""
+
+    def __init__(self, exiftool_path, common_args=()):
+        # Arguments after -common_args are appended to every executed block.
+        # File names arrive as UTF-8 argfile lines, not in the system code page.
+        self.process = subprocess.Popen(
+            [
+                exiftool_path, '-stay_open', 'True', '-@', '-',
+                '-common_args', '-charset', 'filename=utf8', *common_args
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        self.sequence = 0
+
+    def execute(self, args):
+        """Run one command block and return its stdout and stderr output."""
+        self.sequence += 1
+        sentinel = f'{{ready{self.sequence}}}'
+        # -echo4 marks the end of this block on stderr, -executeN on stdout
+        block = args + ['-echo4', sentinel, f'-execute{self.sequence}']
+        try:
+            self.process.stdin.write('\n'.join(block) + '\n')
+            self.process.stdin.flush()
+
+            stdout = self._read_until(self.process.stdout, sentinel)
+            stderr = self._read_until(self.process.stderr, sentinel)
+        except Exception:
+            # Leftover output of this block would be read as the next block's result
+            self.kill()
+            raise
+        return stdout, stderr
+
+    def is_running(self):
+        """Return whether the process can still take commands."""
+        return self.process.poll() is None
+
+    def _read_until(self, stream, sentinel):
+        lines = []
+        while True:
+            line = stream.readline()
+            if not line:
+                raise Exception("ExifTool exited unexpectedly.")
+            if line.strip() == sentinel:
+                return ''.join(lines)
+            lines.append(line)
+
+    def close(self):
+        """Ask ExifTool to exit and wait for the process to finish."""
+        try:
+            self.process.stdin.write('-stay_open\nFalse\n')
+            self.process.stdin.flush()
+            self.process.communicate(timeout=5)
+        except Exception:
+            self.kill()
+
+    def kill(self):
+        """Stop the process immediately."""
+        self.process.kill()
+        self.process.wait()
+
+
+class ProcessWorker(QObject):
+    """Apply dates to a batch of files away from the GUI thread."""
+
+    progress = pyqtSignal(int, int)
+    error = pyqtSignal(str)
+    finished = pyqtSignal(list)
+
+    def __init__(self, files, dates, timestamps, simple_mode, sequential, exiftool_path):
+        super().__init__()
+        self.files = files
+        self.dates = dates
+        self.timestamps = timestamps
+        self.simple_mode = simple_mode
+        self.sequential = sequential
+        self.exiftool_path = exiftool_path
+        self.is_windows = platform.system() == 'Windows'
+        self.is_darwin = platform.system() == 'Darwin'
+        # SetFile calls are only worth batching when files share a date
+        self.batch_creation_times = len(set(timestamps)) < len(timestamps)
+
+    def run(self):
+        """Process every file, reporting progress and per-file errors."""
+        total_files = len(self.files)
+        if self.simple_mode:
+            # Timestamp syscalls wait on storage, not CPU, so keep more of them in flight
+            max_workers = min(32, (os.cpu_count() or 1) + 4, total_files)
+        else:
+            max_workers = min(8, os.cpu_count() or 1, total_files)
+        processed = []
+        errors = []
+
+        # Each worker thread borrows one of these ExifTool processes per file
+        exiftools = queue.Queue()
+
+        # Every file gets the same tags unless times are sequential
+        tag_args = None
+        if not self.simple_mode and not self.sequential:
+            tag_args = self.build_tag_args(self.dates[0])
+
+        def process_file(file_path, date, timestamp):
+            if self.simple_mode:
+                self.modify_file_dates(file_path, timestamp)
+                return
+            exiftool = exiftools.get()
+            try:
+                self.modify_metadata(exiftool, file_path, date, timestamp, tag_args)
+            finally:
+                if not exiftool.is_running():
+                    try:
+                        exiftool = self.start_exiftool()
+                    except Exception:
+                        pass  # Keep the dead process so later files report the failure
+                exiftools.put(exiftool)
+
+        try:
+            if not self.simple_mode:
+                for _ in range(max_workers):
+                    exiftools.put(self.start_exiftool())
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(process_file, file, date, timestamp): (index, file, timestamp)
+                    for index, (file, date, timestamp) in enumerate(zip(self.files, self.dates, self.timestamps))
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    index, file, timestamp = futures[future]
+                    try:
+                        future.result()
+                        processed.append((file, timestamp))
+                    except Exception as e:
+                        errors.append((index, f"Error processing {os.path.basename(file)}: {str(e)}"))
+                    self.progress.emit(done, total_files)
+        except Exception as e:
+            self.error.emit(str(e))
+            return
+        finally:
+            while not exiftools.empty():
+                exiftools.get().close()
+
+        # Report failures in list order rather than completion order
+        errors = [message for _, message in sorted(errors)]
+
+        # Shared macOS creation times are set afterwards, one SetFile call per date
+        if self.is_darwin and self.batch_creation_times:
+            errors.extend(self.set_macos_creation_times(processed))
+
+        self.finished.emit(errors)
+
+    def start_exiftool(self):
+        """Start an ExifTool process for this batch."""
+        return _ExifToolDaemon(self.exiftool_path, ['-overwrite_original'])
+
+    def set_macos_creation_times(self, files):
+        """Set creation dates of (file, timestamp) pairs, batching files per date."""
+        files_by_date = {}
+        for file_path, timestamp in files:
+            files_by_date.setdefault(timestamp, []).append(file_path)
+
+        errors = []
+        for timestamp, paths in files_by_date.items():
+            date_str = datetime.fromtimestamp(timestamp).strftime("%m/%d/%Y %H:%M:%S")
+            # Chunk the paths to stay well under ARG_MAX
+            for start in range(0, len(paths), 500):
+                chunk = paths[start:start + 500]
+                if self.run_setfile(date_str, chunk) is None:
+                    continue
+
+                # Retry one by one so only the files that really fail are reported
+                for file_path in chunk:
+                    message = self.run_setfile(date_str, [file_path])
+                    if message is not None:
+                        errors.append(
+                            f"Error processing {os.path.basename(file_path)}: Error setting creation date: {message}"
+                        )
+        return errors
+
+    def run_setfile(self, date_str, paths):
+        """Run SetFile -d on paths, returning its error message or None."""
+        try:
+            result = subprocess.run(
+                ['SetFile', '-d', date_str, *paths],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+        except OSError as e:
+            return str(e)
+        return result.stderr.strip()[:256] if result.returncode else None
+
+    def modify_file_dates(self, file_path, file_timestamp):
+        """Modify only file system dates to an epoch timestamp."""
+        try:
+            os.utime(file_path, (file_timestamp, file_timestamp))
+            
+            # Handle creation time for different platforms; shared macOS dates are batched in run()
+            if self.is_windows:
+                _set_windows_creation_time(file_path, file_timestamp)
+            elif self.is_darwin and not self.batch_creation_times:
+                date_str = datetime.fromtimestamp(file_timestamp).strftime("%m/%d/%Y %H:%M:%S")
+                message = self.run_setfile(date_str, [file_path])
+                if message is not None:
+                    raise Exception(message)
+                
+        except Exception as e:
+            raise Exception(f"Error modifying file dates: {str(e)}")
+
+    def build_tag_args(self, date):
+        """Build the ExifTool date tag assignments for a datetime."""
+        date_str = date.strftime("%Y:%m:%d %H:%M:%S")
+        # Values stay unquoted: argfile lines reach ExifTool verbatim, quotes included
+        # -AllDates covers CreateDate, DateTimeOriginal and ModifyDate. The File*
+        # tags are filesystem times, which ExifTool only writes when named
+        return [
+            f'-AllDates={date_str}',
+            f'-FileModifyDate={date_str}',
+            f'-FileCreateDate={date_str}',
+            f'-MediaCreateDate={date_str}',
+            f'-MediaModifyDate={date_str}',
+            f'-TrackCreateDate={date_str}',
+            f'-TrackModifyDate={date_str}'
+        ]
+
+    def modify_metadata(self, exiftool, file_path, date, timestamp, tag_args=None):
+        """Modify file metadata using a running ExifTool process."""
+        if tag_args is None:
+            tag_args = self.build_tag_args(date)
+        exiftool_args = tag_args + [file_path]
+
+        _, stderr = exiftool.execute(exiftool_args)
+        exiftool_errors = [line for line in stderr.splitlines() if line.startswith('Error')]
+        if exiftool_errors:
+            raise Exception(f"ExifTool error: {' '.join(exiftool_errors)[:256]}")
+
+        # Also update filesystem timestamps
+        self.modify_file_dates(file_path, timestamp)
+
+
 class MetadataEditor(QMainWindow):
     def __init__(self):
         super().__init__()
         self.files = []
+        self.files_set = set()  # Mirrors self.files for fast duplicate checks
+        self.process_thread = None
+        self.process_worker = None
         self.exiftool_path = self.find_exiftool()
         self.init_ui()
 
@@ -34,19 +328,27 @@ class MetadataEditor(QMainWindow):
                 'exiftool.exe',
             ])
 
+        # Look the candidates up without starting ExifTool, and only run -ver
+        # on ones that exist until one of them works
         for path in possible_paths:
+            if os.path.isabs(path):
+                found = path if os.path.isfile(path) and os.access(path, os.X_OK) else None
+            else:
+                found = shutil.which(path)
+            if not found:
+                continue
+
             try:
                 result = subprocess.run(
-                    [path, '-ver'],
-                    capture_output=True,
-                    text=True
+                    [found, '-ver'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
                 )
-                if result.returncode == 0:
-                    return path
-            except FileNotFoundError:
-                continue
             except Exception:
                 continue
+            if result.returncode == 0:
+                return found
 
         return None
 
@@ -149,9 +451,9 @@ class MetadataEditor(QMainWindow):
         remove_btn.clicked.connect(self.remove_selected)
         btn_layout.addWidget(remove_btn)
         
-        process_btn = QPushButton('Process Files')
-        process_btn.clicked.connect(self.process_files)
-        btn_layout.addWidget(process_btn)
+        self.process_btn = QPushButton('Process Files')
+        self.process_btn.clicked.connect(self.process_files)
+        btn_layout.addWidget(self.process_btn)
         
         layout.addWidget(btn_widget)
 
@@ -167,10 +469,23 @@ class MetadataEditor(QMainWindow):
             "All Files (*)"
         )
         
+        self.add_files(files)
+
+    def add_files(self, files):
+        """Append new files to the list, skipping ones already queued."""
+        new_names = []
         for file_path in files:
-            if file_path not in self.files:
+            if file_path not in self.files_set:
                 self.files.append(file_path)
-                self.file_list.addItem(os.path.basename(file_path))
+                self.files_set.add(file_path)
+                new_names.append(os.path.basename(file_path))
+
+        # Insert in one go so the list lays itself out once
+        self.file_list.setUpdatesEnabled(False)
+        self.file_list.blockSignals(True)
+        self.file_list.addItems(new_names)
+        self.file_list.blockSignals(False)
+        self.file_list.setUpdatesEnabled(True)
 
     def set_current_datetime(self):
         """Set the date and time fields to current time."""
@@ -180,16 +495,32 @@ class MetadataEditor(QMainWindow):
 
     def remove_selected(self):
         """Remove selected files from the list."""
-        selected_items = self.file_list.selectedItems()
-        for item in selected_items:
-            row = self.file_list.row(item)
+        self.remove_rows(self.file_list.row(item) for item in self.file_list.selectedItems())
+
+    def remove_files(self, file_paths):
+        """Remove the given files from the list, keeping any others."""
+        removed = set(file_paths)
+        self.remove_rows(row for row, file_path in enumerate(self.files) if file_path in removed)
+
+    def remove_rows(self, rows):
+        """Remove files at the given list rows."""
+        rows = sorted(rows, reverse=True)
+
+        # Take from the bottom up so earlier removals don't shift later rows
+        self.file_list.setUpdatesEnabled(False)
+        for row in rows:
             self.file_list.takeItem(row)
-            del self.files[row]
+        self.file_list.setUpdatesEnabled(True)
+
+        removed_rows = set(rows)
+        self.files_set.difference_update(self.files[row] for row in removed_rows)
+        self.files = [file_path for row, file_path in enumerate(self.files) if row not in removed_rows]
 
     def clear_files(self):
         """Clear all files from the list."""
         self.file_list.clear()
         self.files.clear()
+        self.files_set.clear()
 
     def mode_button_clicked(self, mode):
         """Handle mode selection button clicks."""
@@ -217,10 +548,7 @@ class MetadataEditor(QMainWindow):
     def dropEvent(self, event):
         """Handle drop events for file drag and drop."""
         files = [url.toLocalFile() for url in event.mimeData().urls()]
-        for file_path in files:
-            if os.path.isfile(file_path) and file_path not in self.files:
-                self.files.append(file_path)
-                self.file_list.addItem(os.path.basename(file_path))
+        self.add_files(file_path for file_path in files if os.path.isfile(file_path))
 
     def process_files(self):
         """Process all files in the list."""
@@ -237,9 +565,13 @@ class MetadataEditor(QMainWindow):
                 "%Y-%m-%d %H:%M:%S"
             )
             
+            # Read the mode toggles once for the whole batch
+            sequential = self.sequential_cb.isChecked()
+            simple_mode = self.simple_mode_btn.isChecked()
+
             # Sort files if using sequential times
             working_files = self.files.copy()
-            if self.sequential_cb.isChecked():
+            if sequential:
                 working_files.sort(key=lambda x: os.path.basename(x).lower())
                 try:
                     interval_seconds = int(self.interval_spinbox.text())
@@ -247,102 +579,88 @@ class MetadataEditor(QMainWindow):
                     QMessageBox.warning(self, "Warning", "Invalid interval value. Using 60 seconds.")
                     interval_seconds = 60
 
-            total_files = len(working_files)
-            processed_files = 0
-            errors = []
-
-            for i, file in enumerate(working_files):
-                if self.sequential_cb.isChecked():
-                    current_datetime = base_datetime.timestamp() + (i * interval_seconds)
-                    current_dt = datetime.fromtimestamp(current_datetime)
-                else:
-                    current_dt = base_datetime
-
-                try:
-                    if self.simple_mode_btn.isChecked():
-                        self.modify_file_dates(file, current_dt)
-                    else:
-                        self.modify_metadata(file, current_dt)
-                    processed_files += 1
-                except Exception as e:
-                    errors.append(f"Error processing {os.path.basename(file)}: {str(e)}")
-
-            # Show results
-            if errors:
-                error_message = "\n".join(errors)
-                QMessageBox.warning(
-                    self,
-                    "Partial Success",
-                    f"Processed {processed_files} out of {total_files} files.\n\nErrors:\n{error_message}"
-                )
+            # Precompute each file's epoch timestamp so workers only touch their own file.
+            # Dates come from the timestamps so EXIF and the filesystem get the same local time.
+            base_timestamp = base_datetime.timestamp()
+            if sequential:
+                timestamps = [base_timestamp + (i * interval_seconds) for i in range(len(working_files))]
+                dates = [datetime.fromtimestamp(timestamp) for timestamp in timestamps]
             else:
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Successfully processed all {total_files} files!"
-                )
+                timestamps = [base_timestamp] * len(working_files)
+                dates = [datetime.fromtimestamp(base_timestamp)] * len(working_files)
 
-            self.clear_files()
+            if not simple_mode and not self.exiftool_path:
+                raise Exception("ExifTool not found. Please install ExifTool first.")
+
+            # Run the batch on a background thread so the window stays responsive
+            self.process_btn.setEnabled(False)
+            self.process_thread = QThread()
+            self.process_worker = ProcessWorker(
+                working_files, dates, timestamps, simple_mode, sequential, self.exiftool_path
+            )
+            self.process_worker.moveToThread(self.process_thread)
+            self.process_thread.started.connect(self.process_worker.run)
+            self.process_worker.progress.connect(self.show_progress)
+            self.process_worker.error.connect(self.show_process_error)
+            self.process_worker.finished.connect(self.show_process_results)
+            self.process_worker.error.connect(self.process_thread.quit)
+            self.process_worker.finished.connect(self.process_thread.quit)
+            self.process_thread.finished.connect(self.process_thread_finished)
+            self.process_thread.start()
 
         except ValueError as e:
             QMessageBox.critical(self, "Error", f"Invalid date/time format: {str(e)}")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"An error occurred: {str(e)}")
 
-    def modify_file_dates(self, file_path, timestamp):
-        """Modify only file system dates."""
-        try:
-            file_timestamp = timestamp.timestamp()
-            os.utime(file_path, (file_timestamp, file_timestamp))
-            
-            # Handle creation time for different platforms
-            if platform.system() == 'Windows':
-                powershell_cmd = f'(Get-Item "{file_path}").CreationTime = (Get-Date "{timestamp}")'
-                subprocess.run(['powershell', '-Command', powershell_cmd], check=True)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['SetFile', '-d', timestamp.strftime("%m/%d/%Y %H:%M:%S"), file_path], check=True)
-                
-        except Exception as e:
-            raise Exception(f"Error modifying file dates: {str(e)}")
+    def show_progress(self, done, total):
+        """Show batch progress in the status bar."""
+        self.statusBar().showMessage(f"Processed {done} of {total} files...")
+
+    def show_process_error(self, message):
+        """Report an error that aborted the whole batch."""
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Error", f"An error occurred: {message}")
+
+    def show_process_results(self, errors):
+        """Summarize a finished batch and drop its files from the list."""
+        batch_files = self.process_worker.files
+        total_files = len(batch_files)
+        processed_files = total_files - len(errors)
+        self.statusBar().clearMessage()
+
+        if errors:
+            error_message = "\n".join(errors)
+            QMessageBox.warning(
+                self,
+                "Partial Success",
+                f"Processed {processed_files} out of {total_files} files.\n\nErrors:\n{error_message}"
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Success",
+                f"Successfully processed all {total_files} files!"
+            )
 
-    def modify_metadata(self, file_path, timestamp):
-        """Modify file metadata using ExifTool."""
-        if not self.exiftool_path:
-            raise Exception("ExifTool not found. Please install ExifTool first.")
-            
-        date_str = timestamp.strftime("%Y:%m:%d %H:%M:%S")
-        
-        exiftool_args = [
-            self.exiftool_path,
-            '-overwrite_original',
-            f'-AllDates="{date_str}"',
-            f'-FileModifyDate="{date_str}"',
-            f'-FileCreateDate="{date_str}"',
-            f'-CreateDate="{date_str}"',
-            f'-ModifyDate="{date_str}"',
-            f'-DateTimeOriginal="{date_str}"',
-            f'-MediaCreateDate="{date_str}"',
-            f'-MediaModifyDate="{date_str}"',
-            f'-TrackCreateDate="{date_str}"',
-            f'-TrackModifyDate="{date_str}"',
-            file_path
-        ]
+        # Files queued while the batch ran were not processed, so keep them
+        self.remove_files(batch_files)
 
-        try:
-            result = subprocess.run(
-                exiftool_args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Also update filesystem timestamps
-            self.modify_file_dates(file_path, timestamp)
-            
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"ExifTool error: {e.stderr}")
-        except Exception as e:
-            raise Exception(f"Error: {str(e)}")
+    def closeEvent(self, event):
+        """Keep the window open until a running batch has finished."""
+        if self.process_thread is not None:
+            QMessageBox.information(self, "Processing", "Please wait for the current batch to finish.")
+            event.ignore()
+        else:
+            event.accept()
+
+    def process_thread_finished(self):
+        """Release the finished worker and allow processing again."""
+        self.process_worker.deleteLater()
+        self.process_thread.deleteLater()
+        self.process_worker = None
+        self.process_thread = None
+        self.process_btn.setEnabled(True)
 
 def main():
     app = QApplication(sys.argv)